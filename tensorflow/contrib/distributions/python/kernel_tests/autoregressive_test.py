@@ -23,6 +23,7 @@ from tensorflow.contrib.distributions.python.ops import independent as independe
 from tensorflow.contrib.distributions.python.ops import test_util
 from tensorflow.contrib.distributions.python.ops.bijectors.affine import Affine
 from tensorflow.contrib.distributions.python.ops.bijectors.masked_autoregressive import MaskedAutoregressiveFlow
+from tensorflow.python.framework import dtypes
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops.distributions import normal as normal_lib
@@ -89,6 +90,142 @@ class AutogressiveTest(test_util.VectorDistributionTestHelpers, test.TestCase):
       td_log_prob_, ar_log_prob_ = sess.run([td.log_prob(x), ar.log_prob(x)])
       self.assertAllClose(td_log_prob_, ar_log_prob_, atol=0., rtol=1e-6)
 
+  def testStepProtocolReceivesSeedAndRunsInOrder(self):
+    """`sample` drives `step` once per step, forwarding its op seed."""
+    event_size = 2
+
+    class _SteppingConditioner(object):
+
+      def __init__(self, fn):
+        self._fn = fn
+        self.calls = []
+
+      def __call__(self, samples):
+        return self._fn(samples)
+
+      def step(self, samples, index, cache, seed=None):
+        self.calls.append((index, seed))
+        return self._fn(samples).sample(seed=seed), cache
+
+    affine = Affine(scale_tril=self._random_scale_tril(event_size))
+    conditioner = _SteppingConditioner(self._normal_fn(affine))
+    ar = autoregressive_lib.Autoregressive(
+        conditioner, array_ops.zeros([event_size]))
+    ar.sample(3, seed=42)
+    self.assertEqual([index for index, _ in conditioner.calls],
+                     list(range(event_size)))
+    for _, seed in conditioner.calls:
+      self.assertIsNotNone(seed)
+
+  def testSamplingDirectionLogProbUsesStrictPrefix(self):
+    """Coordinate i is scored on the revealed prefix, not on `value`."""
+    event_size = 2
+    with self.cached_session() as sess:
+      sample0 = array_ops.zeros([event_size])
+      affine = Affine(scale_tril=self._random_scale_tril(event_size))
+      ar = autoregressive_lib.Autoregressive(
+          self._normal_fn(affine),
+          sample0,
+          validate_args=True,
+          autoregressive_direction="sampling")
+      x = 2. * self._rng.random_sample(
+          [4, event_size]).astype(np.float32) - 1.
+      # Chain-rule reference: score coordinate i under the conditional built
+      # from the strictly revealed prefix, hidden coordinates imputed with
+      # the conditional's mean (zero here). The conditioner's scale_tril has
+      # a diagonal, so this differs from the one-pass evaluation
+      # `fn(x).log_prob(x)` which would leak x[i] into its own scale.
+      expected = array_ops.zeros([4])
+      prefix = np.zeros_like(x)
+      for i in range(event_size):
+        scale = math_ops.exp(affine.forward(prefix))
+        expected += normal_lib.Normal(
+            loc=0., scale=scale[..., i]).log_prob(x[..., i])
+        prefix = prefix.copy()
+        prefix[..., i] = x[..., i]
+      expected_, actual_ = sess.run([expected, ar.log_prob(x)])
+      self.assertAllClose(expected_, actual_, atol=0., rtol=1e-6)
+
+  def testRawConditionerMatchesWrappedSampler(self):
+    """`distribution_fn_raw` samples agree with the wrapped conditioner."""
+    event_size = 2
+    with self.cached_session() as sess:
+      sample0 = array_ops.zeros([event_size])
+      affine = Affine(scale_tril=self._random_scale_tril(event_size))
+
+      def _raw_fn(samples):
+        return (array_ops.zeros_like(samples),
+                math_ops.exp(affine.forward(samples)))
+
+      ar_wrapped = autoregressive_lib.Autoregressive(
+          self._normal_fn(affine), sample0, validate_args=True)
+      ar_raw = autoregressive_lib.Autoregressive(
+          self._normal_fn(affine),
+          sample0,
+          validate_args=True,
+          distribution_fn_raw=_raw_fn)
+      # Identical explicit seeds draw identical noise, so the raw affine
+      # update and the wrapped sampler must produce identical samples.
+      wrapped_, raw_ = sess.run(
+          [ar_wrapped.sample(5, seed=42), ar_raw.sample(5, seed=42)])
+      self.assertAllClose(wrapped_, raw_, atol=1e-6, rtol=1e-6)
+
+  def testComputeDtypeSampleDtypeUnchanged(self):
+    """Reduced-precision recursion still returns samples in `dtype`."""
+    event_size = 2
+
+    def _fn(samples):
+      return independent_lib.Independent(
+          normal_lib.Normal(
+              loc=0. * samples, scale=array_ops.ones_like(samples)),
+          reinterpreted_batch_ndims=1)
+
+    with self.cached_session() as sess:
+      ar = autoregressive_lib.Autoregressive(
+          _fn,
+          array_ops.zeros([event_size]),
+          compute_dtype=dtypes.float16)
+      x = ar.sample(3, seed=42)
+      self.assertEqual(dtypes.float32, x.dtype)
+      x_ = sess.run(x)
+      self.assertEqual((3, event_size), x_.shape)
+
+  def testComposeMatchesSummedLogProb(self):
+    event_size = 2
+    with self.cached_session() as sess:
+      sample0 = array_ops.zeros([event_size])
+      affine = Affine(scale_tril=self._random_scale_tril(event_size))
+      ar = autoregressive_lib.Autoregressive(
+          self._normal_fn(affine), sample0, validate_args=True)
+      composed = autoregressive_lib.Autoregressive.compose([ar, ar])
+      x = 2. * self._rng.random_sample([4, event_size]).astype(np.float32) - 1.
+      composed_log_prob_, ar_log_prob_ = sess.run(
+          [composed.log_prob(x), ar.log_prob(x)])
+      self.assertAllClose(
+          2. * ar_log_prob_, composed_log_prob_, atol=0., rtol=1e-6)
+
+  def testComposeSampleNotImplemented(self):
+    event_size = 2
+    affine = Affine(scale_tril=self._random_scale_tril(event_size))
+    ar = autoregressive_lib.Autoregressive(
+        self._normal_fn(affine), array_ops.zeros([event_size]))
+    composed = autoregressive_lib.Autoregressive.compose([ar, ar])
+    with self.assertRaisesRegexp(NotImplementedError, "unnormalized"):
+      composed.sample(3)
+
+  def testComposeEmptyRaises(self):
+    with self.assertRaisesRegexp(ValueError, "at least one"):
+      autoregressive_lib.Autoregressive.compose([])
+
+  def testInvalidAutoregressiveDirectionRaises(self):
+    event_size = 2
+    affine = Affine(scale_tril=self._random_scale_tril(event_size))
+    with self.assertRaisesRegexp(ValueError, "autoregressive_direction"):
+      autoregressive_lib.Autoregressive(
+          self._normal_fn(affine),
+          array_ops.zeros([event_size]),
+          autoregressive_direction="diagonal")
+
 
 if __name__ == "__main__":
   test.main()
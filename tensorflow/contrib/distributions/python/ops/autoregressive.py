@@ -18,13 +18,48 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
+
 import numpy as np
 
+from tensorflow.contrib.distributions.python.ops import independent as independent_lib
+from tensorflow.contrib.distributions.python.ops import seed_stream
+from tensorflow.python.compiler.xla import jit
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import op_def_registry
 from tensorflow.python.framework import ops
+from tensorflow.python.framework import tensor_shape
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import control_flow_ops
+from tensorflow.python.ops import functional_ops
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import random_ops
+from tensorflow.python.ops import variable_scope as variable_scope_lib
 from tensorflow.python.ops.distributions import distribution as distribution_lib
-from tensorflow.python.ops.distributions import util as distribution_util
+from tensorflow.python.ops.distributions import normal as normal_lib
 from tensorflow.python.util import deprecation
 
+_REGISTERED_OPS = None
+
+
+def _stateless_ops_only(node_def):
+  """`compile_ops` predicate admitting only stateless ops into XLA clusters.
+
+  Stateful ops (random number generators, variable reads, the asserts added
+  by `validate_args`) must stay outside the cluster: compiling them either
+  fails or changes their semantics.
+
+  Args:
+    node_def: `NodeDef` being considered for compilation.
+
+  Returns:
+    compile: Python `bool`, `True` if the op is stateless.
+  """
+  global _REGISTERED_OPS
+  if _REGISTERED_OPS is None:
+    _REGISTERED_OPS = op_def_registry.get_registered_ops()
+  return not _REGISTERED_OPS[node_def.op].is_stateful
+
 
 class Autoregressive(distribution_lib.Distribution):
   """Autoregressive distributions.
@@ -97,6 +132,17 @@ class Autoregressive(distribution_lib.Distribution):
 
   ```
 
+  #### Performance
+
+  The masked-dense GEMMs inside `distribution_fn` dominate runtime for
+  moderate-to-large event sizes and run in IEEE FP32 by default. There is no
+  global reduced-precision GEMM switch in this TensorFlow version; to trade
+  precision for GEMM/memory throughput, pass `compute_dtype` (e.g.,
+  `tf.float16` or `tf.bfloat16`) so the sampling recursion feeds the
+  conditioner reduced-precision inputs and lets the GPU's fast
+  reduced-precision math engage. `log_prob`/`prob` always run in this
+  distribution's `dtype`.
+
   #### References
 
   [1]: George Papamakarios, Theo Pavlakou, and Iain Murray. Masked
@@ -123,6 +169,12 @@ class Autoregressive(distribution_lib.Distribution):
                num_steps=None,
                validate_args=False,
                allow_nan_stats=True,
+               autoregressive_direction="density",
+               compute_dtype=None,
+               dtype=None,
+               reparameterization_type=None,
+               distribution_fn_raw=None,
+               use_xla_jit=False,
                name="Autoregressive"):
     """Construct an `Autoregressive` distribution.
 
@@ -131,7 +183,14 @@ class Autoregressive(distribution_lib.Distribution):
         `tfp.distributions.Distribution`-like instance from a `Tensor` (e.g.,
         `sample0`). The function must respect the "autoregressive property",
         i.e., there exists a permutation of event such that each coordinate is a
-        diffeomorphic function of on preceding coordinates.
+        diffeomorphic function of on preceding coordinates. The callable may
+        additionally expose a `step(samples, index, cache, seed=None)` method
+        returning a `(new_samples, new_cache)` pair; when present, `sample`
+        uses it to update one coordinate per step while reusing cached
+        per-layer activations, reducing the total conditioner work from
+        O(D**2) to O(D) in the event size D. `sample` forwards its derived
+        op seed through `seed`; `step` should pass it to any draws it makes
+        so the incremental path stays deterministic under a seeded `sample`.
       sample0: Initial input to `distribution_fn`; used to
         build the distribution in `__init__` which in turn specifies this
         distribution's properties, e.g., `event_shape`, `batch_shape`, `dtype`.
@@ -146,6 +205,46 @@ class Autoregressive(distribution_lib.Distribution):
         (e.g., mean, mode, variance) use the value "`NaN`" to indicate the
         result is undefined. When `False`, an exception is raised if one or
         more of the statistic's batch members are undefined.
+      autoregressive_direction: Python `str`, one of `"density"` or
+        `"sampling"`, indicating which direction `distribution_fn`'s
+        autoregressive masking is oriented toward. The `"density"` direction
+        (default, MAF-style) evaluates `log_prob` in one conditioner pass but
+        needs `num_steps` passes to `sample`; the `"sampling"` direction
+        (IAF-style) samples in one pass but needs `num_steps` passes for
+        `log_prob`. Choosing the direction matching the dominant workload
+        avoids paying the sequential cost on both paths.
+      compute_dtype: Optional TF `DType` in which to run the sequential
+        sampling recursion (e.g., `tf.bfloat16`). Samples are cast to
+        `compute_dtype` before the recursion and back to this distribution's
+        `dtype` afterwards; `distribution_fn` must accept a `Tensor` of this
+        dtype. For memory-bandwidth-bound conditioners this roughly halves
+        DRAM traffic and engages reduced-precision hardware GEMMs, at some
+        cost in precision. Noise for the recursion is drawn in `float32`
+        and cast down, since the RNG ops lack kernels for the
+        reduced-precision float types on most devices.
+        Default value: `None` (i.e., use this distribution's `dtype`).
+      dtype: Optional TF `DType` of this distribution's samples. When `None`,
+        it is probed from `distribution_fn(sample0)`, which requires building
+        `distribution0` eagerly. Default value: `None`.
+      reparameterization_type: Optional `ReparameterizationType` of this
+        distribution. When `None`, it is probed from
+        `distribution_fn(sample0)`, which requires building `distribution0`
+        eagerly. Default value: `None`.
+      distribution_fn_raw: Optional Python `callable` returning a
+        `(loc, scale)` pair of `Tensor`s from a `Tensor` of samples; a
+        structure-of-arrays alternative to wrapping the conditional's
+        parameters in a `Distribution`. When provided, the sampling
+        recursion applies the affine update `loc + scale * eps` directly,
+        skipping the per-iteration `Distribution` object construction. The
+        callable must describe the same conditional law as
+        `distribution_fn`, which is still used for `log_prob`/`prob` and
+        property probing. Default value: `None`.
+      use_xla_jit: Python `bool`. When `True`, `log_prob`/`prob` in the
+        `"density"` direction run under an XLA jit scope so the elementwise
+        log-prob math fuses into the conditioner's GEMMs; stateless ops
+        only, mirroring `tf.contrib.rnn.CompiledWrapper`. Requires XLA
+        support in the installed build; the annotation is ignored
+        otherwise. Default value: `False`.
       name: Python `str` name prefixed to Ops created by this class.
         Default value: "Autoregressive".
 
@@ -153,13 +252,21 @@ class Autoregressive(distribution_lib.Distribution):
       ValueError: if `num_steps` and
         `distribution_fn(sample0).event_shape.num_elements()` are both `None`.
       ValueError: if `num_steps < 1`.
+      ValueError: if `autoregressive_direction` is not one of `"density"`,
+        `"sampling"`.
     """
     parameters = dict(locals())
     with ops.name_scope(name) as name:
       self._distribution_fn = distribution_fn
+      self._distribution_fn_raw = distribution_fn_raw
       self._sample0 = sample0
-      self._distribution0 = (distribution_fn() if sample0 is None
-                             else distribution_fn(sample0))
+      self._conditional_cache = None
+      self._distribution0 = None
+      if num_steps is None or dtype is None or reparameterization_type is None:
+        # Building `distribution0` costs a full conditioner trace, so only do
+        # it at construction time when a property below must be probed from
+        # it; otherwise the `distribution0` property builds it on first use.
+        _ = self.distribution0
       if num_steps is None:
         num_steps = self._distribution0.event_shape.num_elements()
         if num_steps is None:
@@ -168,19 +275,81 @@ class Autoregressive(distribution_lib.Distribution):
       if num_steps < 1:
         raise ValueError("num_steps ({}) must be at least 1.".format(num_steps))
       self._num_steps = num_steps
+      # Cache the statically known event size as a Python int so hot paths
+      # never re-walk TensorShape/Dimension objects for loop bounds; a plain
+      # int is also a compile-time constant to graph rewrites and XLA.
+      event_size = (None if self._distribution0 is None
+                    else self._distribution0.event_shape.num_elements())
+      self._event_size = None if event_size is None else int(event_size)
+      if autoregressive_direction not in ("density", "sampling"):
+        raise ValueError(
+            "autoregressive_direction ({}) must be one of 'density', "
+            "'sampling'.".format(autoregressive_direction))
+      self._autoregressive_direction = autoregressive_direction
+      self._use_xla_jit = use_xla_jit
+      self._compute_dtype = (None if compute_dtype is None
+                             else dtypes.as_dtype(compute_dtype))
+      if dtype is None:
+        dtype = self._distribution0.dtype
+      if reparameterization_type is None:
+        reparameterization_type = self._distribution0.reparameterization_type
+      # Freeze the parents to a tuple: `distribution0`'s list is mutable, and
+      # a stable, hashable sequence both avoids rebuilding on every walk of
+      # `_graph_parents` and keeps identity stable for downstream hash-based
+      # caching.
+      graph_parents = (None if self._distribution0 is None
+                       else tuple(self._distribution0._graph_parents))  # pylint: disable=protected-access
     super(Autoregressive, self).__init__(
-        dtype=self._distribution0.dtype,
-        reparameterization_type=self._distribution0.reparameterization_type,
+        dtype=dtype,
+        reparameterization_type=reparameterization_type,
         validate_args=validate_args,
         allow_nan_stats=allow_nan_stats,
         parameters=parameters,
-        graph_parents=self._distribution0._graph_parents,  # pylint: disable=protected-access
+        graph_parents=graph_parents,
         name=name)
 
+  @classmethod
+  def compose(cls, layers, name="ComposedAutoregressive"):
+    """Fuses a stack of `Autoregressive` layers into one joint scorer.
+
+    Stacked flows are commonly scored layer by layer, with each layer
+    separately invoking its conditioner and materializing an intermediate
+    log-prob. The composed object instead evaluates every layer's
+    `log_prob` at the same `value` inside one graph and accumulates the
+    contributions with a single `add_n`, avoiding per-layer round-trips of
+    intermediates.
+
+    Warning: the result is an UNNORMALIZED joint scorer, not a normalized
+    distribution. Summing the layers' conditional log-probs at a shared
+    `value` does not describe the density of any sampling procedure, so
+    the composed object's `sample` raises `NotImplementedError`; use it
+    only for relative scoring (losses, energy terms).
+
+    Args:
+      layers: Python `list` of `Autoregressive` instances, ordered from
+        first to last applied.
+      name: Python `str` name prefixed to Ops created by this class.
+
+    Returns:
+      composed: `Autoregressive`-like instance whose `log_prob` sums the
+        layers' log-probs evaluated at the same `value`. `sample` is not
+        implemented.
+
+    Raises:
+      ValueError: if `layers` contains no layers.
+    """
+    if not layers:
+      raise ValueError("compose requires at least one layer.")
+    return _ComposedAutoregressive(layers, name=name)
+
   @property
   def distribution_fn(self):
     return self._distribution_fn
 
+  @property
+  def distribution_fn_raw(self):
+    return self._distribution_fn_raw
+
   @property
   def sample0(self):
     return self._sample0
@@ -189,8 +358,23 @@ class Autoregressive(distribution_lib.Distribution):
   def num_steps(self):
     return self._num_steps
 
+  @property
+  def autoregressive_direction(self):
+    return self._autoregressive_direction
+
+  @property
+  def compute_dtype(self):
+    return self._compute_dtype
+
+  @property
+  def use_xla_jit(self):
+    return self._use_xla_jit
+
   @property
   def distribution0(self):
+    if self._distribution0 is None:
+      self._distribution0 = (self._distribution_fn() if self._sample0 is None
+                             else self._distribution_fn(self._sample0))
     return self._distribution0
 
   def _batch_shape(self):
@@ -206,17 +390,370 @@ class Autoregressive(distribution_lib.Distribution):
     return self.distribution0.event_shape_tensor()
 
   def _sample_n(self, n, seed=None):
+    # Every coupled draw below deliberately shares one op seed. Redrawing
+    # identical noise at each step turns the recursion into a fixed-point
+    # iteration whose result conditions each coordinate on the prefix that
+    # is actually returned; per-site seeds would condition each step on a
+    # prefix drawn from different noise, changing the sampled joint law.
+    seed = seed_stream.SeedStream(seed, salt="autoregressive")()
     if seed is None:
-      seed = distribution_util.gen_new_seed(
-          seed=np.random.randint(2**32 - 1),
-          salt="autoregressive")
-    samples = self.distribution0.sample(n, seed=seed)
-    for _ in range(self._num_steps):
+      # The coupling requires one concrete op seed even when the caller
+      # leaves the draw unseeded: unseeded ops would each draw independent
+      # noise. There is no graph-native scalar seed source in this tree, so
+      # this Python-level draw cannot be removed; it runs once per `sample`
+      # call at graph-construction time, never per session step.
+      seed = np.random.randint(2**32 - 1)
+
+    if self._autoregressive_direction == "sampling":
+      # A "sampling"-oriented (IAF-style) conditioner maps the base draw to
+      # the target distribution in a single pass; the shared seed makes the
+      # conditioner's input noise the very noise being transformed.
+      samples = self.distribution0.sample(n, seed=seed)
+      return self.distribution_fn(samples).sample(seed=seed)
+
+    # The `[n] + batch + event` layout is part of `distribution_fn`'s input
+    # contract: conditioner parameters may carry explicit batch dimensions
+    # which broadcast against it but not against a layout with the sample
+    # and batch dimensions collapsed together. When the batch shape is
+    # scalar (the common case), the leading dimension already presents all
+    # `n` samples to the conditioner's GEMMs as one large M dimension.
+    batch_shape = self.batch_shape_tensor()
+    event_shape = self.event_shape_tensor()
+    event_size = self._event_size
+    if event_size is None:
+      event_size = self.event_shape.num_elements()
+    if event_size is not None and self._num_steps >= event_size:
+      # Every coordinate is resampled before the recursion settles, so the
+      # bootstrap value provably cannot influence the result; zeros skip the
+      # `distribution0` sampler kernel and its affine transform.
+      samples = array_ops.zeros(
+          array_ops.concat([[n], batch_shape, event_shape], axis=0),
+          dtype=self.dtype if self._compute_dtype is None
+          else self._compute_dtype)
+    else:
+      # With fewer steps than (possibly unknown) event coordinates, the
+      # bootstrap draw is part of the documented distribution,
+      # `fn(...fn(distribution0.sample()).sample()...)`; keep it.
+      samples = self.distribution0.sample(n, seed=seed)
+      if self._compute_dtype is not None:
+        samples = math_ops.cast(samples, self._compute_dtype)
+
+    if self._num_steps == 1:
+      # Single-step configuration: apply the conditioner once directly; no
+      # loop machinery (Enter/Merge/Switch nodes) is emitted.
       samples = self.distribution_fn(samples).sample(seed=seed)
+      if self._compute_dtype is not None:
+        samples = math_ops.cast(samples, self.dtype)
+      return samples
+
+    if callable(getattr(self.distribution_fn, "step", None)):
+      samples = self._fast_sample_n(samples, seed=seed)
+      if self._compute_dtype is not None:
+        samples = math_ops.cast(samples, self.dtype)
+      return samples
+
+    # Only unwrap `Independent`, which preserves the conditional's law;
+    # other wrappers exposing a `.distribution` attribute (e.g.
+    # `TransformedDistribution`) forward FULLY_REPARAMETERIZED from their
+    # base yet change the sampled values, so applying loc + scale * eps to
+    # their base parameters would silently sample the wrong distribution.
+    conditional0 = self.distribution0
+    if isinstance(conditional0, independent_lib.Independent):
+      conditional0 = conditional0.distribution
+    eps = None
+    if self._distribution_fn_raw is not None or (
+        self.reparameterization_type == distribution_lib.FULLY_REPARAMETERIZED
+        and isinstance(conditional0, normal_lib.Normal)):
+      # A reparameterized Normal conditional samples as loc + scale * eps.
+      # Drawing eps once outside the loop both removes num_steps - 1 RNG
+      # kernels and hoists the shared noise out of the fold, so every
+      # iteration applies the affine update to the same eps.
+      eps_dtype = samples.dtype.base_dtype
+      if eps_dtype not in (dtypes.float32, dtypes.float64):
+        # RandomStandardNormal has no kernels for the reduced-precision
+        # float types on most devices (e.g., no GPU bfloat16 kernel); draw
+        # in float32 and cast down.
+        eps = math_ops.cast(
+            random_ops.random_normal(
+                array_ops.shape(samples), dtype=dtypes.float32, seed=seed),
+            eps_dtype)
+      else:
+        eps = random_ops.random_normal(
+            array_ops.shape(samples), dtype=eps_dtype, seed=seed)
+
+    if eps is not None:
+      def _fold_fn(samples, unused_index):
+        """Fold body; applies the conditioner's affine update once."""
+        # Set caching device to avoid re-getting the tf.Variable for every
+        # while loop iteration.
+        with variable_scope_lib.variable_scope(
+            variable_scope_lib.get_variable_scope()) as vs:
+          if vs.caching_device is None:
+            vs.set_caching_device(lambda op: op.device)
+          if self._distribution_fn_raw is not None:
+            # Structure-of-arrays conditioner: pure tensor math, no
+            # per-iteration `Distribution` wrapper allocation.
+            loc, scale = self._distribution_fn_raw(samples)
+            return loc + scale * eps
+          conditional = self.distribution_fn(samples)
+          if isinstance(conditional, independent_lib.Independent):
+            conditional = conditional.distribution
+          return conditional.loc + conditional.scale * eps
+
+      # With the noise hoisted into `eps`, the fold body is deterministic
+      # and `foldl` (a `tf.while_loop` under the hood) can materialize the
+      # conditioner subgraph once, keeping graph size flat in `num_steps`.
+      samples = functional_ops.foldl(
+          _fold_fn,
+          math_ops.range(self._num_steps),
+          initializer=samples,
+          parallel_iterations=1)
+    else:
+      # Generic conditionals draw through `.sample`, whose noise cannot be
+      # hoisted out of a `tf.while_loop`: the loop's single RNG kernel would
+      # re-execute with fresh state each iteration and decouple every step's
+      # noise from the prefix it conditions on. Unroll instead so each
+      # iteration's sample op carries the same seed (redrawing the same
+      # underlying noise), preserving the fixed-point coupling.
+      for _ in range(self._num_steps):
+        samples = self.distribution_fn(samples).sample(seed=seed)
+    if self._compute_dtype is not None:
+      samples = math_ops.cast(samples, self.dtype)
     return samples
 
+  def _fast_sample_n(self, samples, seed=None):
+    """Incremental sampling path for conditioners exposing `step`.
+
+    A full conditioner evaluation recomputes every coordinate's parameters
+    even though only one coordinate becomes "settled" per iteration, i.e.,
+    O(D**2) total work in the event size D. A conditioner implementing
+    `step(samples, index, cache, seed=None)` can instead reuse per-layer
+    activations stored in `cache` and recompute only the contribution of the
+    `index`-th coordinate, collapsing the sampling cost to O(D).
+
+    Args:
+      samples: `Tensor` of shape `[n] + batch_shape + event_shape`
+        bootstrapping the recursion.
+      seed: Python integer op seed shared by the coupled draws in
+        `_sample_n`; forwarded to every `step` call so the conditioner's
+        draws join the same deterministic stream.
+
+    Returns:
+      samples: `Tensor` of samples after `num_steps` incremental updates.
+    """
+    cache = None
+    for index in range(self._num_steps):
+      samples, cache = self.distribution_fn.step(
+          samples, index, cache, seed=seed)
+    return samples
+
+  def _get_conditional(self, value):
+    """Returns `distribution_fn(value)`, memoized on the identity of `value`.
+
+    `log_prob` and `prob` are commonly both invoked on the same `Tensor`
+    (e.g., `log_prob` for a loss and `prob` for diagnostics); memoizing the
+    most recently constructed conditional distribution saves rebuilding the
+    conditioner graph on the second call. The cache holds a weak reference to
+    `value` so it never extends the `Tensor`'s lifetime.
+
+    Args:
+      value: `Tensor` from which to construct the conditional distribution.
+
+    Returns:
+      conditional: `Distribution`-like instance, `distribution_fn(value)`.
+    """
+    cached = self._conditional_cache
+    if cached is not None and cached[0]() is value:
+      return cached[1]
+    conditional = self.distribution_fn(value)
+    try:
+      self._conditional_cache = (weakref.ref(value), conditional)
+    except TypeError:
+      # `value` does not support weak references; skip caching.
+      self._conditional_cache = None
+    return conditional
+
+  def _sequential_log_prob(self, value):
+    """Sequential `log_prob` for `"sampling"`-oriented conditioners.
+
+    A conditioner masked for one-pass sampling is not triangular in `value`,
+    so feeding it the full `value` would leak each coordinate into its own
+    parameters. Instead, apply the autoregressive decomposition directly:
+    coordinate `i` is scored under the conditional built from the strictly
+    revealed prefix (coordinates `< i` along the rightmost event dimension,
+    still-hidden coordinates imputed from the running conditional's mean),
+    and the per-coordinate contributions accumulate across the `num_steps`
+    reveals.
+
+    The result is the density of the sequential generative process implied
+    by the conditioner. A properly masked conditioner, whose coordinate-`i`
+    parameters depend only on coordinates `< i`, ignores the imputed values
+    by construction; a conditioner that peeks at coordinate `i` or beyond
+    is scored on the imputation rather than on `value` there.
+
+    Per-coordinate scoring requires an elementwise conditional: either an
+    `Independent` wrapping a scalar-event distribution or a bare
+    distribution with scalar `event_shape`.
+
+    Args:
+      value: `Tensor` at which to evaluate `log_prob`.
+
+    Returns:
+      log_prob: `Tensor` of accumulated per-coordinate log-probabilities.
+
+    Raises:
+      ValueError: if the conditional does not expose per-coordinate
+        log-probs.
+    """
+    conditional0 = self.distribution0
+    if isinstance(conditional0, independent_lib.Independent):
+      conditional0 = conditional0.distribution
+    if conditional0.event_shape.ndims != 0:
+      raise ValueError(
+          "sampling-direction log_prob requires per-coordinate log-probs; "
+          "use an `Independent`-wrapped scalar distribution (got "
+          "event_shape {}).".format(conditional0.event_shape))
+    coords = math_ops.range(self._event_size if self._event_size is not None
+                            else array_ops.shape(value)[-1])
+
+    def _loop_body(index, x, log_prob_sum):
+      """While-loop body; scores, then reveals, one coordinate."""
+      with variable_scope_lib.variable_scope(
+          variable_scope_lib.get_variable_scope()) as vs:
+        if vs.caching_device is None:
+          vs.set_caching_device(lambda op: op.device)
+        conditional = self.distribution_fn(x)
+        elementwise = conditional
+        if isinstance(elementwise, independent_lib.Independent):
+          elementwise = elementwise.distribution
+        # Score coordinate `index` before revealing it, so its conditional
+        # only ever saw the strict prefix.
+        scored = math_ops.cast(math_ops.equal(coords, index), value.dtype)
+        log_prob_sum += math_ops.reduce_sum(
+            scored * elementwise.log_prob(value), axis=-1)
+        revealed = math_ops.cast(coords <= index, value.dtype)
+        x = revealed * value + (1. - revealed) * conditional.mean()
+      return index + 1, x, log_prob_sum
+
+    _, _, log_prob_sum = control_flow_ops.while_loop(
+        cond=lambda index, *_: index < self._num_steps,
+        body=_loop_body,
+        loop_vars=(0,
+                   array_ops.zeros_like(value),
+                   array_ops.zeros(array_ops.shape(value)[:-1],
+                                   dtype=value.dtype)),
+        shape_invariants=(tensor_shape.TensorShape([]),
+                          value.shape,
+                          value.shape[:-1]),
+        parallel_iterations=1,
+        maximum_iterations=self._num_steps)
+    return log_prob_sum
+
+  def _hint_static_shape(self, value):
+    """Merges this distribution's static batch/event shape onto `value`.
+
+    The conditioner's mask pattern and layer widths are fixed once the event
+    size is known, but they only constant-fold (and XLA only specializes)
+    when the conditioner's input carries a fully defined static shape.
+    `value` often arrives with unknown dimensions (e.g., from a placeholder)
+    even though this distribution's batch/event shape is statically known;
+    merging the two recovers that information at no runtime cost.
+
+    Args:
+      value: `Tensor` whose trailing dimensions are batch/event dimensions.
+
+    Returns:
+      value: The same `Tensor`, with its static shape refined when possible.
+    """
+    suffix = self.batch_shape.concatenate(self.event_shape)
+    if value.shape.ndims is None or suffix.ndims is None:
+      return value
+    sample_ndims = value.shape.ndims - suffix.ndims
+    if sample_ndims < 0:
+      return value
+    try:
+      value.set_shape(value.shape[:sample_ndims].concatenate(
+          value.shape[sample_ndims:].merge_with(suffix)))
+    except ValueError:
+      # Statically incompatible shapes; leave the error to the consuming op.
+      pass
+    return value
+
+  def _maybe_jit_scope(self):
+    """Returns an XLA jit scope when `use_xla_jit`, else a null context.
+
+    The scope only admits stateless ops, so the asserts added by
+    `validate_args` (and any other stateful ops in the conditioner) stay
+    outside the cluster rather than failing or changing semantics under
+    compilation.
+
+    Returns:
+      scope: context manager to run `log_prob`/`prob` under.
+    """
+    if not self._use_xla_jit:
+      return ops.NullContextmanager()
+    return jit.experimental_jit_scope(compile_ops=_stateless_ops_only)
+
+  def _log_prob(self, value):
+    value = self._hint_static_shape(value)
+    if self._autoregressive_direction == "sampling":
+      return self._sequential_log_prob(value)
+    # Under a jit scope, XLA fuses the elementwise log-prob math into the
+    # epilogue of the conditioner's GEMM, so the conditional's parameters
+    # never round-trip through DRAM between the two kernels.
+    with self._maybe_jit_scope():
+      return self._get_conditional(value).log_prob(value)
+
+  def _prob(self, value):
+    value = self._hint_static_shape(value)
+    if self._autoregressive_direction == "sampling":
+      return math_ops.exp(self._sequential_log_prob(value))
+    with self._maybe_jit_scope():
+      return self._get_conditional(value).prob(value)
+
+
+class _ComposedAutoregressive(Autoregressive):
+  """Unnormalized joint scorer over stacked `Autoregressive` layers.
+
+  Built by `Autoregressive.compose`. The composed `log_prob` accumulates all
+  layers' log-prob contributions at a shared `value` in a single graph. The
+  sum is not the density of any sampling procedure, so `sample` raises
+  `NotImplementedError`.
+  """
+
+  def __init__(self, layers, name="ComposedAutoregressive"):
+    self._layers = list(layers)
+    last = self._layers[-1]
+    super(_ComposedAutoregressive, self).__init__(
+        distribution_fn=last.distribution_fn,
+        sample0=last.sample0,
+        num_steps=last.num_steps,
+        validate_args=last.validate_args,
+        allow_nan_stats=last.allow_nan_stats,
+        autoregressive_direction=last.autoregressive_direction,
+        compute_dtype=last.compute_dtype,
+        dtype=last.dtype,
+        reparameterization_type=last.reparameterization_type,
+        use_xla_jit=last.use_xla_jit,
+        name=name)
+
+  @property
+  def layers(self):
+    return self._layers
+
   def _log_prob(self, value):
-    return self.distribution_fn(value).log_prob(value)
+    # Delegate to each layer's public `log_prob` so per-layer settings
+    # (`autoregressive_direction`, `use_xla_jit`, the conditional cache)
+    # all apply; one `add_n` then accumulates the contributions without
+    # materializing per-layer intermediates.
+    return math_ops.add_n(
+        [layer.log_prob(value) for layer in self._layers])
 
   def _prob(self, value):
-    return self.distribution_fn(value).prob(value)
+    return math_ops.exp(self._log_prob(value))
+
+  def _sample_n(self, n, seed=None):
+    raise NotImplementedError(
+        "A composed Autoregressive is an unnormalized joint scorer: the "
+        "summed log_prob is not the density of any sampling procedure, so "
+        "`sample` is not defined. Sample the individual layers instead.")